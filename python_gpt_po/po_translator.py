@@ -1,65 +1,275 @@
+# pylint: disable=too-many-lines
 """
 GPT Translator
 """
 
 
 import argparse
+import hashlib
 import json
 import logging
 import os
+import re
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Optional
 
 import polib
 import pycountry
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import (APIConnectionError, APIStatusError, APITimeoutError, InternalServerError, OpenAI, OpenAIError,
+                    RateLimitError)
 from pkg_resources import DistributionNotFound, get_distribution
-from tenacity import retry, stop_after_attempt, wait_fixed
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - tiktoken is optional, token counts are estimated without it
+    tiktoken = None
 
 # Initialize environment variables and logging
 load_dotenv()
 logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# All known ISO 639-1 codes, used to validate two-letter codes without a pycountry lookup
+_ISO_639_1_CODES = frozenset(
+    language.alpha_2 for language in pycountry.languages if hasattr(language, 'alpha_2')
+)
+
+# Typographic double quotes models sometimes emit as JSON string delimiters, mapped back to ASCII in one pass
+_SMART_QUOTE_TABLE = str.maketrans(dict.fromkeys('\u201c\u201d\u201e\u201f\u00ab\u00bb', '"'))
+
+# Phrases that signal the model explained the text instead of translating it
+_EXPLANATION_INDICATORS = ("I'm sorry", "I cannot", "This refers to", "This means", "In this context")
+_EXPLANATION_RE = re.compile('|'.join(map(re.escape, _EXPLANATION_INDICATORS)), re.IGNORECASE)
+
+# Roughly 30 tokens; explanations announce themselves within the opening words of a streamed reply
+_STREAM_CHECK_CHARS = 120
+
+
+def _json_dumps(obj):
+    """Serializes obj to compact JSON, keeping non-ASCII text as-is so prompts stay small."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+def _json_loads(text):
+    """Parses JSON text; orjson's JSONDecodeError subclasses json.JSONDecodeError, so callers catch the latter."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+@lru_cache(maxsize=512)
+def _normalize_language_code(lang):
+    """Convert language name or code to ISO 639-1 code, caching the result per distinct input."""
+    # Try direct lookup
+    if len(lang) == 2:
+        code = lang.lower()
+        if code in _ISO_639_1_CODES:
+            return code
+
+    # Try by name
+    try:
+        return pycountry.languages.get(name=lang.title()).alpha_2
+    except AttributeError:
+        pass
+
+    # Try by native name
+    lowered = lang.lower()
+    for language in pycountry.languages:
+        if hasattr(language, 'inverted_name') and language.inverted_name.lower() == lowered:
+            return language.alpha_2
+
+    return None
+
+
+def _estimate_tokens(text):
+    """Roughly estimates the number of tokens in a text (about 4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+@lru_cache(maxsize=8)
+def _token_counter(model):
+    """
+    Returns a function counting the tokens of a text for model.
+
+    Uses the model's tiktoken encoding when tiktoken is installed and knows the model, otherwise the estimate.
+    """
+    if tiktoken is None:
+        return _estimate_tokens
+    try:
+        encoding = tiktoken.encoding_for_model(model)
+    except Exception as e:  # unknown model, or the encoding could not be downloaded
+        logger.debug("No tiktoken encoding for %s, estimating tokens instead: %s", model, e)
+        return _estimate_tokens
+    # + 1 for the quotes and separator around each text in the JSON array
+    return lambda text: len(encoding.encode_ordinary(text)) + 1
+
+
+def _needs_translation(entry):
+    """
+    Returns True if the entry has no translation yet and has text worth sending to the API.
+
+    Whitespace-only msgids are skipped: gettext falls back to the msgid, which is already correct. Obsolete (#~)
+    entries are skipped like in polib's untranslated_entries(), since gettext never uses them. isspace() is used
+    instead of strip() so no stripped copy of either string is built.
+    """
+    msgid, msgstr = entry.msgid, entry.msgstr
+    return bool(msgid) and not entry.obsolete and not msgid.isspace() and (not msgstr or msgstr.isspace())
+
+
+def _is_fuzzy(entry):
+    """Returns True if the .po entry is flagged as fuzzy."""
+    return 'fuzzy' in entry.flags
 
 
 class POFileHandler:
     """Handles operations related to .po files."""
 
+    __slots__ = ()
+
     @staticmethod
     def disable_fuzzy_translations(po_file_path):
-        """Disables fuzzy translations in a .po file."""
+        """
+        Disables fuzzy translations in a .po file.
+
+        Returns the parsed (unflagged) file so callers can reuse it, or None if the file was not parsed here.
+        """
         try:
             # Read the file content
             with open(po_file_path, 'r', encoding='utf-8') as file:
                 content = file.read()
 
-            # Remove fuzzy markers from the content
-            content = content.replace('#, fuzzy\n', '')
+            # Nothing to do if the file carries no fuzzy flag at all
+            if 'fuzzy' not in content:
+                return None
 
-            # Write the updated content back to the file
-            with open(po_file_path, 'w', encoding='utf-8') as file:
-                file.write(content)
+            # Parse the text already in memory instead of reading the file again
+            po_file = polib.pofile(content)
+            changed = False
 
-            # Load the .po file and remove fuzzy flags from entries
-            po_file = polib.pofile(po_file_path)
-            fuzzy_entries = [entry for entry in po_file if 'fuzzy' in entry.flags]
-            for entry in fuzzy_entries:
+            # polib keeps the header entry's flags in metadata_is_fuzzy
+            if po_file.metadata_is_fuzzy and 'fuzzy' in po_file.metadata_is_fuzzy:
+                po_file.metadata_is_fuzzy = 0
+                changed = True
+
+            # Remove fuzzy flags from entries
+            for entry in POFileHandler.iter_fuzzy_entries(po_file):
                 entry.flags.remove('fuzzy')
+                changed = True
 
             # Remove 'Fuzzy' from the metadata if present
-            if po_file.metadata:
-                po_file.metadata.pop('Fuzzy', None)
+            if po_file.metadata and po_file.metadata.pop('Fuzzy', None) is not None:
+                changed = True
 
-            # Save the updated .po file
-            po_file.save(po_file_path)
-            logging.info("Fuzzy translations disabled in file: %s", po_file_path)
+            # Save the updated .po file once, and only if something was unflagged
+            if changed:
+                POFileHandler.save_po_file(po_file, po_file_path)
+                logger.info("Fuzzy translations disabled in file: %s", po_file_path)
+            return po_file
 
-        except Exception as e:
-            logging.error("Error while disabling fuzzy translations in file %s: %s", po_file_path, e)
+        except (OSError, ValueError) as e:
+            logger.error("Error while disabling fuzzy translations in file %s: %s", po_file_path, e)
+            return None
+
+    @staticmethod
+    def atomic_write(path, write):
+        """
+        Calls write(tmp_path) and then moves the temporary file over path.
+
+        A crash or error mid-write leaves the original file untouched instead of truncated. The temporary file gets
+        a unique name next to path, so it cannot clobber another file or collide with a concurrent run, and takes
+        over the permission bits of the file it replaces. A symlinked path is written through to its target.
+        """
+        path = os.path.realpath(path)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(path) or None, prefix=f".{os.path.basename(path)}.", suffix='.tmp'
+        )
+        os.close(fd)
+        try:
+            write(tmp_path)
+            if os.path.exists(path):
+                shutil.copymode(path, tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @staticmethod
+    def save_po_file(po_file, po_file_path):
+        """Saves a .po file atomically."""
+        POFileHandler.atomic_write(po_file_path, po_file.save)
+
+    @staticmethod
+    def iter_fuzzy_entries(po_file):
+        """Lazily yields the entries of a .po file that carry the fuzzy flag."""
+        yield from (entry for entry in po_file if _is_fuzzy(entry))
+
+    @staticmethod
+    def iter_po_files(root):
+        """
+        Lazily yields the paths of all .po files below root.
+
+        Uses os.scandir, whose entries carry the file type from the directory listing, so most files need no extra
+        stat call. Symlinked directories are not followed, matching os.walk; unreadable directories are skipped.
+        """
+        pending = [root]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name.endswith(".po") and entry.is_file():
+                            yield entry.path
+            except OSError as e:
+                logger.warning("Cannot scan directory %s: %s", directory, e)
+
+    @staticmethod
+    def process_files(po_file_paths, func, max_workers=None):
+        """
+        Applies func to each .po file path in a thread pool and returns the results in path order.
+
+        A file that raises is logged and gets a None result; the remaining files are still processed. Worker counts
+        below 1 are treated as 1 (sequential).
+        """
+        results = [None] * len(po_file_paths)
+        if max_workers is not None:
+            max_workers = max(1, max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(func, path): index for index, path in enumerate(po_file_paths)}
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    logger.error("Error processing file %s: %s", po_file_paths[index], e)
+        return results
 
     @staticmethod
     def get_file_language(po_file_path, po_file, languages, folder_language):
         """Determines the language for a .po file."""
         file_lang = po_file.metadata.get('Language', '')
+
+        # Fast path: the metadata already holds one of the requested codes
+        if file_lang in languages:
+            return file_lang
+
         normalized_lang = POFileHandler.normalize_language_code(file_lang)
 
         if normalized_lang in languages:
@@ -67,9 +277,12 @@ class POFileHandler:
 
         if folder_language:
             for part in po_file_path.split(os.sep):
+                if part in languages:
+                    logger.info("Inferred language for .po file: %s as %s", po_file_path, part)
+                    return part
                 norm_part = POFileHandler.normalize_language_code(part)
                 if norm_part in languages:
-                    logging.info("Inferred language for .po file: %s as %s", po_file_path, norm_part)
+                    logger.info("Inferred language for .po file: %s as %s", po_file_path, norm_part)
                     return norm_part
 
         return None
@@ -77,25 +290,7 @@ class POFileHandler:
     @staticmethod
     def normalize_language_code(lang):
         """Convert language name or code to ISO 639-1 code."""
-        # Try direct lookup
-        if len(lang) == 2:
-            try:
-                return pycountry.languages.get(alpha_2=lang.lower()).alpha_2
-            except AttributeError:
-                pass
-
-        # Try by name
-        try:
-            return pycountry.languages.get(name=lang.title()).alpha_2
-        except AttributeError:
-            pass
-
-        # Try by native name
-        for language in pycountry.languages:
-            if hasattr(language, 'inverted_name') and language.inverted_name.lower() == lang.lower():
-                return language.alpha_2
-
-        return None
+        return _normalize_language_code(lang)
 
     @staticmethod
     def log_translation_status(po_file_path, original_texts, translations):
@@ -105,15 +300,16 @@ class POFileHandler:
 
         # Log a warning if there are untranslated texts
         if translated < total:
-            logging.warning(
+            logger.warning(
                 "File: %s - %s/%s texts translated. Some translations are missing.",
                 po_file_path, translated, total
             )
-            for original, translation in zip(original_texts, translations):
-                if not translation:
-                    logging.warning("Missing translation for: '%s'", original)
+            if logger.isEnabledFor(logging.WARNING):
+                for original, translation in zip(original_texts, translations):
+                    if not translation:
+                        logger.warning("Missing translation for: '%s'", original)
         else:
-            logging.info("File: %s - All %s texts successfully translated.", po_file_path, total)
+            logger.info("File: %s - All %s texts successfully translated.", po_file_path, total)
 
     @staticmethod
     def update_po_entry(po_file, original_text, translated_text):
@@ -121,22 +317,279 @@ class POFileHandler:
         entry = po_file.find(original_text)
         if entry:
             entry.msgstr = translated_text
-            logging.debug("Updated translation for '%s' to '%s'", original_text, translated_text)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Updated translation for '%s' to '%s'", original_text, translated_text)
         else:
-            logging.warning("Original text '%s' not found in the .po file.", original_text)
+            logger.warning("Original text '%s' not found in the .po file.", original_text)
+
+
+class TranslationCache:
+    """
+    Store of translations shared by all files processed in a run.
+
+    Lookups are served from memory. When a database path is given, translations are also persisted in SQLite
+    so later runs only send new or changed strings to the API. With max_age (in seconds), stored translations
+    older than that are purged when the database is opened, so they are translated again.
+    """
+
+    __slots__ = ('_translations', '_lock', '_connection')
+
+    # Stays below SQLITE_MAX_VARIABLE_NUMBER (999) of older SQLite builds
+    _FETCH_BATCH = 500
+
+    def __init__(self, path=None, max_age=None):
+        self._translations = {}
+        self._lock = threading.Lock()
+        self._connection = None
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            # WAL lets concurrent runs read while one writes; NORMAL sync is durable enough for a cache
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS translations "
+                "(key TEXT PRIMARY KEY, translation TEXT NOT NULL, created INTEGER NOT NULL)"
+            )
+            self._connection.commit()
+            if max_age is not None:
+                self.purge(max_age)
+
+    @staticmethod
+    def make_key(model, target_language, detail_language, text):
+        """Builds a stable key for a source text translated with the given model and language."""
+        raw_key = f"{model}|{target_language}|{detail_language or ''}|{text}"
+        return hashlib.blake2b(raw_key.encode('utf-8'), digest_size=16).hexdigest()
+
+    def get(self, model, target_language, detail_language, text):
+        """Returns the cached translation, or None if the text has not been translated yet."""
+        return self.get_many(model, target_language, detail_language, [text])[0]
+
+    def get_many(self, model, target_language, detail_language, texts):
+        """Returns the cached translation (or None) for each text, in order."""
+        keys = [self.make_key(model, target_language, detail_language, text) for text in texts]
+        with self._lock:
+            translations = [self._translations.get(key) for key in keys]
+            if self._connection is not None:
+                misses = list({key for key, translation in zip(keys, translations) if translation is None})
+                if misses:
+                    self._translations.update(self._fetch(misses))
+                    translations = [self._translations.get(key) for key in keys]
+        return translations
+
+    def _fetch(self, keys):
+        """Reads the stored translations for keys from the database, a few hundred keys per query."""
+        rows = []
+        for start in range(0, len(keys), self._FETCH_BATCH):
+            batch = keys[start:start + self._FETCH_BATCH]
+            rows.extend(self._connection.execute(
+                f"SELECT key, translation FROM translations WHERE key IN ({','.join('?' * len(batch))})", batch
+            ))
+        return rows
+
+    def set(self, model, target_language, detail_language, text, translation):
+        """Stores a translation; empty translations are not cached so they are retried later."""
+        self.set_many(model, target_language, detail_language, [(text, translation)])
+
+    def set_many(self, model, target_language, detail_language, pairs):
+        """Stores (text, translation) pairs in one go, skipping empty translations."""
+        rows = [
+            (self.make_key(model, target_language, detail_language, text), translation)
+            for text, translation in pairs
+            if translation and translation.strip()
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._translations.update(rows)
+            if self._connection is not None:
+                created = int(time.time())
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO translations (key, translation, created) VALUES (?, ?, ?)",
+                    [(key, translation, created) for key, translation in rows]
+                )
+                self._connection.commit()
+
+    def purge(self, max_age=None):
+        """
+        Drops stored translations older than max_age seconds, or all of them when max_age is None.
+
+        Returns the number of rows removed from the database.
+        """
+        with self._lock:
+            self._translations.clear()
+            if self._connection is None:
+                return 0
+            if max_age is None:
+                cursor = self._connection.execute("DELETE FROM translations")
+            else:
+                cursor = self._connection.execute(
+                    "DELETE FROM translations WHERE created < ?", (int(time.time() - max_age),)
+                )
+            self._connection.commit()
+        if cursor.rowcount:
+            logger.info("Purged %d cached translations", cursor.rowcount)
+        return cursor.rowcount
+
+    def close(self):
+        """Closes the backing database, if any."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class RateLimiter:
+    """Thread-safe token bucket that spreads a per-minute budget over time."""
+
+    __slots__ = ('capacity', '_available', '_refill_rate', '_updated', '_lock')
+
+    def __init__(self, per_minute):
+        if per_minute <= 0:
+            raise ValueError(f"Rate limit must be positive, got {per_minute}")
+        self.capacity = float(per_minute)
+        self._available = self.capacity
+        self._refill_rate = self.capacity / 60.0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount=1):
+        """Blocks until the requested amount fits within the budget, then consumes it."""
+        amount = min(amount, self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._available = min(self.capacity, self._available + (now - self._updated) * self._refill_rate)
+                self._updated = now
+                if self._available >= amount:
+                    self._available -= amount
+                    return
+                wait = (amount - self._available) / self._refill_rate
+            time.sleep(wait)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the API while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Short-circuits API calls for a while after too many consecutive failures.
+
+    Once reset_timeout has passed the breaker is half-open: a single trial call is let through and every other
+    caller keeps failing fast until that call is recorded as a success or a failure.
+    """
+
+    __slots__ = ('fail_max', 'reset_timeout', '_failures', '_opened_at', '_trial_running', '_lock')
+
+    def __init__(self, fail_max=5, reset_timeout=30):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """Raises CircuitOpenError while the breaker is open; admits one trial call once it expires."""
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if self._trial_running or time.monotonic() - self._opened_at < self.reset_timeout:
+                raise CircuitOpenError(
+                    f"API calls suspended after {self._failures} consecutive failures"
+                )
+            self._trial_running = True
+
+    def record_success(self):
+        """Closes the breaker after a successful call."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self):
+        """Counts a failed call and opens (or re-opens) the breaker once the limit is reached."""
+        with self._lock:
+            self._trial_running = False
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                if self._opened_at is None:
+                    logger.error("Opening circuit breaker after %d consecutive API failures", self._failures)
+                self._opened_at = time.monotonic()
+
+
+# Where translations are persisted when --cache is given without a path
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'python-gpt-po', 'cache.sqlite')
+
+# Errors raised by the API layer that callers recover from locally
+API_ERRORS = (OpenAIError, CircuitOpenError)
+
+# Transient API errors worth retrying; anything else (auth, bad request, bad output) fails fast
+RETRYABLE_API_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+
+# HTTP statuses that signal a transient condition even though the SDK has no dedicated exception for them
+RETRYABLE_STATUS_CODES = frozenset((408, 409, 425))
+
+
+def _is_retryable_error(exc):
+    """Returns True for API errors that may succeed on a later attempt."""
+    if isinstance(exc, RETRYABLE_API_ERRORS):
+        return True
+    return isinstance(exc, APIStatusError) and exc.status_code in RETRYABLE_STATUS_CODES
+
+
+# Longest delay honoured from a Retry-After header, matching the cap of the exponential backoff
+MAX_RETRY_AFTER = 60
+
+_backoff = wait_random_exponential(multiplier=1, min=1, max=MAX_RETRY_AFTER)
+
+
+def _retry_after_seconds(exc):
+    """Returns the delay the server asked for in its retry-after(-ms) headers, or None if it gave none."""
+    response = getattr(exc, 'response', None)
+    if response is None:
+        return None
+    for header, scale in (('retry-after-ms', 0.001), ('retry-after', 1)):
+        value = response.headers.get(header)
+        if value is None:
+            continue
+        try:
+            return min(max(float(value) * scale, 0), MAX_RETRY_AFTER)
+        except ValueError:
+            # HTTP-date values are rare for this API; fall back to the exponential backoff
+            continue
+    return None
+
+
+def _retry_wait(retry_state):
+    """Waits as long as the server asked for when it said so, otherwise backs off exponentially with jitter."""
+    delay = _retry_after_seconds(retry_state.outcome.exception())
+    return _backoff(retry_state) if delay is None else delay
 
 
 @dataclass
-class TranslationConfig:
+class TranslationConfig:  # pylint: disable=too-many-instance-attributes
     """ Class to hold configuration parameters for the translation service. """
     client: object
     model: str
     bulk_mode: bool = False
     fuzzy: bool = False
     folder_language: bool = False
-
-
-class TranslationService:
+    max_concurrency: int = 8
+    file_workers: int = 8
+    bulk_token_budget: int = 2500
+    strict_validation: bool = False
+    stream: bool = False
+    requests_per_minute: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
+    cache_path: Optional[str] = None
+    cache_max_age: Optional[float] = None
+
+
+class TranslationService:  # pylint: disable=too-many-instance-attributes
     """ Class to encapsulate translation functionalities. """
 
     def __init__(self, config, batch_size=40):
@@ -144,68 +597,253 @@ class TranslationService:
         self.batch_size = batch_size  # Use the bulk size provided by the user
         self.total_batches = 0
         self.po_file_handler = POFileHandler()
+        self.cache = TranslationCache(config.cache_path, config.cache_max_age)
+        self.request_limiter = RateLimiter(config.requests_per_minute) if config.requests_per_minute else None
+        self.token_limiter = RateLimiter(config.tokens_per_minute) if config.tokens_per_minute else None
+        self.circuit_breaker = CircuitBreaker()
+        # Shared by every file worker, so max_concurrency bounds requests across the whole run, not per file
+        self._request_slots = threading.BoundedSemaphore(max(1, config.max_concurrency))
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+
+    def _create_completion(self, messages, abort_pattern=None):
+        """
+        Sends a chat completion request and returns the reply text.
+
+        Requests wait for the configured rate limits and a free request slot, and fail fast while the circuit breaker
+        is open. With config.stream and an abort_pattern, the reply is streamed and abandoned as soon as its opening
+        matches the pattern; the partial text is returned so the caller's validation can react without the full
+        generation.
+        """
+        if self.request_limiter:
+            self.request_limiter.acquire()
+        if self.token_limiter:
+            self.token_limiter.acquire(sum(_estimate_tokens(message["content"]) for message in messages))
+
+        self.circuit_breaker.before_call()
+        try:
+            with self._request_slots:
+                if self.config.stream and abort_pattern is not None:
+                    content = self._stream_completion(messages, abort_pattern)
+                else:
+                    completion = self.config.client.chat.completions.create(
+                        model=self.config.model,
+                        messages=messages
+                    )
+                    content = completion.choices[0].message.content or ""
+        except OpenAIError as e:
+            # Only transient failures say the API is unhealthy; a rejected request (bad input, auth) got an answer
+            if _is_retryable_error(e):
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+            raise
+        except Exception:
+            # Anything else (e.g. a malformed reply or a broken stream) must still release a half-open trial
+            self.circuit_breaker.record_failure()
+            raise
+        self.circuit_breaker.record_success()
+        return content
+
+    def _stream_completion(self, messages, abort_pattern):
+        """Streams a completion, closing the stream early once the opening text matches abort_pattern."""
+        stream = self.config.client.chat.completions.create(
+            model=self.config.model,
+            messages=messages,
+            stream=True
+        )
+        parts = []
+        received = 0
+        checked = False
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                parts.append(delta)
+                received += len(delta)
+                if not checked and received >= _STREAM_CHECK_CHARS:
+                    checked = True
+                    if abort_pattern.search(''.join(parts)):
+                        logger.debug("Aborting streamed response after %d characters", received)
+                        break
+        finally:
+            stream.close()
+        return ''.join(parts)
 
     def validate_openai_connection(self):
-        """Validates the OpenAI connection by making a test API call."""
+        """
+        Validates the OpenAI connection.
+
+        By default this looks up the configured model, a free metadata call that checks both the API key and the
+        model name. With strict_validation a (billed) test completion is sent instead.
+        """
         try:
-            test_message = {"role": "system", "content": "Test message to validate connection."}
-            self.config.client.chat.completions.create(model=self.config.model, messages=[test_message])
-            logging.info("OpenAI connection validated successfully.")
+            if self.config.strict_validation:
+                test_message = {"role": "system", "content": "Test message to validate connection."}
+                self._create_completion([test_message])
+            else:
+                self.config.client.models.retrieve(self.config.model)
+            logger.info("OpenAI connection validated successfully.")
             return True
-        except Exception as e:
-            logging.error("Failed to validate OpenAI connection: %s", str(e))
+        except API_ERRORS as e:
+            logger.error("Failed to validate OpenAI connection: %s", str(e))
             return False
 
     def translate_bulk(self, texts, target_language, po_file_path, detail_language=None):
-        """Translates a list of texts in bulk, processing in smaller chunks."""
-        translated_texts = []
-        chunk_size = self.batch_size
-
-        for i in range(0, len(texts), chunk_size):
-            chunk = texts[i:i + chunk_size]
-            logging.info("Translating chunk %d of %d", i // chunk_size + 1, (len(texts) - 1) // chunk_size + 1)
+        """
+        Translates a list of texts in bulk, processing in smaller chunks.
 
-            try:
-                translations = self.perform_translation(
-                    chunk, target_language, is_bulk=True, detail_language=detail_language
-                )
-                translated_texts.extend(translations)
-            except Exception as e:
-                logging.error("Bulk translation failed for chunk %d: %s", i // chunk_size + 1, str(e))
-                for text in chunk:
-                    try:
-                        translation = self.perform_translation(
-                            text, target_language, is_bulk=False, detail_language=detail_language
-                        )
-                        translated_texts.append(translation)
-                    except Exception as inner_e:
-                        logging.error("Individual translation failed for text '%s': %s", text, str(inner_e))
-                        translated_texts.append("")  # Placeholder for failed translation
-
-            logging.info("Processed %d out of %d translations", len(translated_texts), len(texts))
+        Cached texts are reused and repeated texts are sent once, then fanned back out to every position. Nothing is
+        sent when every text is cached, and a single remaining text skips the JSON bulk protocol.
+        """
+        cached = self.cache.get_many(self.config.model, target_language, detail_language, texts)
+        pending = list(dict.fromkeys(text for text, translation in zip(texts, cached) if translation is None))
+        missing = sum(translation is None for translation in cached)
+        if missing < len(texts):
+            logger.info("Reusing %d cached translations in %s", len(texts) - missing, po_file_path)
+        if len(pending) < missing:
+            logger.info("Sending %d unique of %d uncached texts in %s", len(pending), missing, po_file_path)
+
+        if not pending:
+            return cached
+        if len(pending) == 1:
+            translated = {pending[0]: self.translate_single(pending[0], target_language, detail_language)}
+        else:
+            translated = dict(zip(
+                pending, self._translate_bulk_uncached(pending, target_language, po_file_path, detail_language)
+            ))
+        return [
+            translation if translation is not None else translated.get(text, "")
+            for text, translation in zip(texts, cached)
+        ]
+
+    def _translate_bulk_uncached(self, texts, target_language, po_file_path, detail_language=None):
+        """Translates texts missing from the cache in concurrently dispatched chunks and stores the results."""
+        chunks = self._pack_chunks(texts)
+        translate_chunk = partial(
+            self._translate_chunk,
+            target_language=target_language,
+            total_chunks=len(chunks),
+            detail_language=detail_language
+        )
+        # Results come back in chunk order, however the requests interleave
+        translated_texts = [
+            translation
+            for chunk_translations in self._map_concurrently(translate_chunk, list(enumerate(chunks, 1)))
+            for translation in chunk_translations
+        ]
 
         if len(translated_texts) != len(texts):
-            logging.error(
+            logger.error(
                 "Translation count mismatch in %s. Expected %d, got %d",
                 po_file_path, len(texts), len(translated_texts)
             )
 
-        return translated_texts
+        # Rejected texts (None) are left out of the cache and keep their source text in the file
+        self.cache.set_many(self.config.model, target_language, detail_language, zip(texts, translated_texts))
+        return [text if translation is None else translation for text, translation in zip(texts, translated_texts)]
+
+    def _pack_chunks(self, texts):
+        """
+        Greedily groups texts into bulk chunks.
+
+        A chunk closes when it reaches batch_size texts or when the next text would push its token count past
+        bulk_token_budget, so short labels share a request while long paragraphs don't overflow the reply. Tokens
+        are counted with tiktoken when available and estimated otherwise.
+        """
+        count_tokens = _token_counter(self.config.model)
+        chunks = []
+        chunk = []
+        chunk_tokens = 0
+        for text in texts:
+            tokens = count_tokens(text)
+            if chunk and (len(chunk) >= self.batch_size or chunk_tokens + tokens > self.config.bulk_token_budget):
+                chunks.append(chunk)
+                chunk = []
+                chunk_tokens = 0
+            chunk.append(text)
+            chunk_tokens += tokens
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def _translate_chunk(self, numbered_chunk, target_language, total_chunks, detail_language=None):
+        """Translates one (chunk number, texts) pair, falling back to individual requests if the bulk call fails."""
+        chunk_num, chunk = numbered_chunk
+        logger.info("Translating chunk %d of %d", chunk_num, total_chunks)
+
+        try:
+            translations = self.perform_translation(
+                chunk, target_language, is_bulk=True, detail_language=detail_language
+            )
+        except Exception as e:
+            logger.error("Bulk translation failed for chunk %d: %s", chunk_num, str(e))
+            # Sequential on purpose: this already runs on a chunk worker, and a nested pool per failed chunk would
+            # only add threads queueing on the shared request slots
+            translations = [self._translate_fallback(text, target_language, detail_language) for text in chunk]
+
+        logger.info("Finished chunk %d of %d", chunk_num, total_chunks)
+        return translations
+
+    def _translate_fallback(self, text, target_language, detail_language=None):
+        """Translates one text of a failed bulk chunk on its own, returning "" if that fails too."""
+        try:
+            return self.perform_translation(text, target_language, is_bulk=False, detail_language=detail_language)
+        except Exception as e:
+            logger.error("Individual translation failed for text '%s': %s", text, str(e))
+            return ""  # Placeholder for failed translation
 
     def translate_single(self, text, target_language, detail_language=None):
         """Translates a single text."""
+        cached = self.cache.get(self.config.model, target_language, detail_language, text)
+        if cached is not None:
+            return cached
+
+        # If another worker is already translating this text, wait for its result instead of paying twice
+        key = TranslationCache.make_key(self.config.model, target_language, detail_language, text)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight[key] = Future()
+        if not is_owner:
+            return future.result()
+
+        translation = ""
+        try:
+            # The previous owner may have finished between the cache miss above and taking the lock
+            cached = self.cache.get(self.config.model, target_language, detail_language, text)
+            if cached is not None:
+                translation = cached
+            else:
+                translation = self._translate_single_uncached(text, target_language, detail_language)
+            return translation
+        finally:
+            future.set_result(translation)
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _translate_single_uncached(self, text, target_language, detail_language=None):
+        """Translates a single text through the API and caches the result."""
         try:
             translation = self.perform_translation(
                 text, target_language, is_bulk=False, detail_language=detail_language
             )
-            if not translation.strip():
-                logging.warning("Empty translation returned for '%s'. Attempting without validation.", text)
+            if translation is not None and not translation.strip():
+                logger.warning("Empty translation returned for '%s'. Attempting without validation.", text)
                 translation = self.perform_translation_without_validation(
                     text, target_language, detail_language=detail_language
                 )
+            if translation is None:
+                # No acceptable answer: keep the source text, uncached so a later run asks the API again
+                return text
+            self.cache.set(self.config.model, target_language, detail_language, text, translation)
             return translation
         except Exception as e:
-            logging.error("Error translating '%s': %s", text, str(e))
+            logger.error("Error translating '%s': %s", text, str(e))
             return ""
 
     def perform_translation_without_validation(self, text, target_language, detail_language=None):
@@ -225,32 +863,34 @@ class TranslationService:
         }
 
         try:
-            completion = self.config.client.chat.completions.create(
-                model=self.config.model,
-                messages=[message]
-            )
-            return self.post_process_translation(text, completion.choices[0].message.content.strip())
-        except Exception as e:
-            logging.error("Error in perform_translation_without_validation: %s", str(e))
+            response = self._create_completion([message])
+            return self.post_process_translation(text, response.strip())
+        except API_ERRORS as e:
+            logger.error("Error in perform_translation_without_validation: %s", str(e))
             return ""
 
     @staticmethod
     def post_process_translation(original, translated):
-        """Post-processes the translation to handle repetitions and long translations."""
+        """
+        Post-processes the translation to handle repetitions and long translations.
+
+        Returns None when the translation is too long to be anything but an explanation.
+        """
         if ' - ' in translated:
             parts = translated.split(' - ')
             if len(parts) == 2 and parts[0] == parts[1]:
                 return parts[0]
 
         if len(translated.split()) > 2 * len(original.split()) + 1:
-            logging.warning("Translation seems too long, might be an explanation: '%s'", translated)
-            return original
+            logger.warning("Translation seems too long, might be an explanation: '%s'", translated)
+            return None
 
         return translated
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def get_translation_prompt(target_language, is_bulk, detail_language=None):
-        """Returns the appropriate translation prompt based on the translation mode."""
+        """Returns the appropriate translation prompt based on the translation mode (memoized per arguments)."""
         # Use detailed language if provided, otherwise use the short target language code
         target_lang_text = detail_language if detail_language else target_language
 
@@ -272,130 +912,205 @@ class TranslationService:
             "Here is the text to translate:\n"
         )
 
-    @retry(stop=stop_after_attempt(3), wait=wait_fixed(2))
+    @retry(
+        stop=stop_after_attempt(5),
+        wait=_retry_wait,
+        retry=retry_if_exception(_is_retryable_error),
+        reraise=True
+    )
     def perform_translation(self, texts, target_language, is_bulk=False, detail_language=None):
         """Performs the actual translation using the OpenAI API."""
-        logging.debug("Performing translation to: %s", target_language)  # Log the target language
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Performing translation to: %s", target_language)  # Log the target language
         prompt = self.get_translation_prompt(target_language, is_bulk, detail_language)
         message = {
             "role": "user",
-            "content": prompt + (json.dumps(texts) if is_bulk else texts)
+            "content": prompt + (_json_dumps(texts) if is_bulk else texts)
         }
 
         try:
-            completion = self.config.client.chat.completions.create(
-                model=self.config.model,
-                messages=[message]
-            )
-            response = completion.choices[0].message.content.strip()
+            # validate_translation trims each result and the JSON parser ignores surrounding whitespace
+            response = self._create_completion([message], abort_pattern=None if is_bulk else _EXPLANATION_RE)
 
             if is_bulk:
-                try:
-                    translated_texts = json.loads(response)
-                    if not isinstance(translated_texts, list) or len(translated_texts) != len(texts):
-                        raise ValueError("Invalid response format")
-                    return [
-                        self.validate_translation(original, translated)
-                        for original, translated in zip(texts, translated_texts)
-                    ]
-                except json.JSONDecodeError as e:
-                    logging.error("Invalid JSON response: %s", response)
-                    raise ValueError("Invalid JSON response") from e
-            else:
-                return self.validate_translation(texts, response)
+                return self._process_bulk_response(texts, message, response, target_language, detail_language)
+            return self.validate_translation(texts, response, detail_language or target_language)
         except Exception as e:
-            logging.error("Translation error: %s", str(e))
+            logger.error("Translation error: %s", str(e))
             raise
 
-    def validate_translation(self, original, translated):
-        """Validates the translation and retries if necessary."""
-        translated = translated.strip()
+    def _process_bulk_response(self, texts, message, response, target_language, detail_language=None):
+        """
+        Parses and validates a bulk response.
+
+        Invalid JSON is first re-parsed with typographic quotes normalized, then gets one repair request instead of a
+        full resend. A well-formed array of the wrong length is rejected: a cut-off reply is not valid JSON, so a
+        short array means an item was dropped or merged somewhere and the positions no longer line up.
+        """
+        cleaned = self._clean_json_response(response)
+        try:
+            translated_texts = _json_loads(cleaned)
+        except json.JSONDecodeError as e:
+            try:
+                translated_texts = _json_loads(cleaned.translate(_SMART_QUOTE_TABLE))
+            except json.JSONDecodeError:
+                logger.error("Invalid JSON response: %s", response)
+                translated_texts = self._repair_bulk_response(message, response, e)
+
+        if not isinstance(translated_texts, list) or len(translated_texts) != len(texts):
+            raise ValueError("Invalid response format")
+        if not all(isinstance(translated, str) for translated in translated_texts):
+            raise ValueError("Invalid response format")
+
+        return self._validate_bulk_translations(texts, translated_texts, detail_language or target_language)
+
+    def _validate_bulk_translations(self, texts, translated_texts, target_language):
+        """
+        Validates bulk translations against their originals.
+
+        Every translation is checked first and only the rejected ones are retried. The retries run one after
+        another: this already runs on a chunk worker, other chunks keep their requests in flight meanwhile, and
+        _request_slots bounds the total, so a nested pool per chunk would only add threads.
+        """
+        results = [translated.strip() for translated in translated_texts]
+        rejected = [
+            i for i, (original, translated) in enumerate(zip(texts, results))
+            if self._rejection_reason(original, translated)
+        ]
+        if rejected:
+            logger.warning(
+                "Retrying %d of %d bulk translations that were too long or explanatory", len(rejected), len(results)
+            )
+            for i in rejected:
+                results[i] = self.retry_long_translation(texts[i], target_language)
+        return results
+
+    def _repair_bulk_response(self, message, response, error):
+        """Asks the model to resend its previous bulk answer as valid JSON and returns the parsed result."""
+        repair_message = {
+            "role": "user",
+            "content": f"Your previous response was not valid JSON. Error: {error}. Return ONLY the JSON array."
+        }
+        repaired = self._create_completion([message, {"role": "assistant", "content": response}, repair_message])
+        try:
+            return _json_loads(self._clean_json_response(repaired))
+        except json.JSONDecodeError as e:
+            logger.error("Invalid JSON response after repair request: %s", repaired)
+            raise ValueError("Invalid JSON response") from e
 
+    @staticmethod
+    def _clean_json_response(response_text):
+        """Extracts the JSON array from a bulk response, dropping markdown fences or surrounding prose."""
+        # The outermost array, wherever the model put it (e.g. inside a ```json fence); find/rfind scan in C
+        start = response_text.find('[')
+        end = response_text.rfind(']')
+        return response_text[start:end + 1] if 0 <= start < end else response_text.strip()
+
+    @staticmethod
+    def _rejection_reason(original, translated):
+        """Returns why a (stripped) translation must be retried, or None if it is acceptable."""
         if len(translated.split()) > 2 * len(original.split()) + 1:
-            logging.warning("Translation too long, retrying: %s -> %s", original[:50], translated[:50])
-            return self.retry_long_translation(original, self.config.model.split('-')[-1])
+            return "too long"
+        if _EXPLANATION_RE.search(translated):
+            return "contains explanation"
+        return None
 
-        explanation_indicators = ["I'm sorry", "I cannot", "This refers to", "This means", "In this context"]
-        if any(indicator.lower() in translated.lower() for indicator in explanation_indicators):
-            logging.warning("Translation contains explanation: %s", translated[:50])
-            return self.retry_long_translation(original, self.config.model.split('-')[-1])
+    def validate_translation(self, original, translated, target_language=None):
+        """Validates the translation and retries if necessary; returns None if no acceptable translation was found."""
+        translated = translated.strip()
 
-        return translated
+        reason = self._rejection_reason(original, translated)
+        if reason is None:
+            return translated
 
-    def retry_long_translation(self, text, target_language):
-        """Retries translation for long or explanatory responses."""
-        prompt = (
+        logger.warning("Translation %s, retrying: %s -> %s", reason, original[:50], translated[:50])
+        return self.retry_long_translation(original, target_language or self.config.model.split('-')[-1])
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def get_retry_prompt(target_language):
+        """Returns the prompt asking for a concise retranslation (memoized per language)."""
+        return (
             f"Translate this text concisely from English to {target_language}. "
             "Provide only the direct translation without any explanation or additional context. "
             "Keep special characters, placeholders, and formatting intact. "
             "If a term should not be translated (like 'URL' or technical terms), keep it as is.\n"
             "Text to translate:\n"
         )
+
+    def retry_long_translation(self, text, target_language):
+        """Retries translation for long or explanatory responses, returning None if the retry fails as well."""
         message = {
             "role": "user",
-            "content": prompt + text
+            "content": self.get_retry_prompt(target_language) + text
         }
         try:
-            completion = self.config.client.chat.completions.create(
-                model=self.config.model,
-                messages=[message]
-            )
-            retried_translation = completion.choices[0].message.content.strip()
+            retried_translation = self._create_completion([message]).strip()
 
             if len(retried_translation.split()) > 2 * len(text.split()) + 1:
-                logging.warning("Retried translation still too long: %s -> %s", text[:50], retried_translation[:50])
-                return text
+                logger.warning("Retried translation still too long: %s -> %s", text[:50], retried_translation[:50])
+                return None
 
-            logging.info("Successfully retried translation: %s -> %s", text[:50], retried_translation[:50])
+            logger.info("Successfully retried translation: %s -> %s", text[:50], retried_translation[:50])
             return retried_translation
-        except Exception as e:
-            logging.error("Error in retry_long_translation: %s", str(e))
-            return text
+        except API_ERRORS as e:
+            logger.error("Error in retry_long_translation: %s", str(e))
+            return None
 
     def scan_and_process_po_files(self, input_folder, languages):
         """Scans and processes .po files in the given input folder."""
-        for root, _, files in os.walk(input_folder):
-            for file in filter(lambda f: f.endswith(".po"), files):
-                logging.debug("File: %s", file)
-                po_file_path = os.path.join(root, file)
-                logging.info("Discovered .po file: %s", po_file_path)  # Log each discovered file
-                self.process_po_file(po_file_path, languages)
+        po_file_paths = list(self.po_file_handler.iter_po_files(input_folder))
+        if logger.isEnabledFor(logging.INFO):
+            for po_file_path in po_file_paths:
+                logger.info("Discovered .po file: %s", po_file_path)  # Log each discovered file
+
+        # Files are independent, so their I/O-bound processing can overlap
+        self.po_file_handler.process_files(
+            po_file_paths,
+            partial(self.process_po_file, languages=languages),
+            max_workers=self.config.file_workers
+        )
 
     def process_po_file(self, po_file_path, languages):
         """Processes .po files"""
         try:
-            po_file = self._prepare_po_file(po_file_path, languages)
-            if not po_file:
+            po_file, file_lang = self._prepare_po_file(po_file_path, languages)
+            if po_file is None:
                 return
 
-            # Use file_lang obtained from get_file_language method
-            file_lang = self.po_file_handler.get_file_language(
-                po_file_path,
-                po_file,
-                languages,
-                self.config.folder_language
-            )
+            # Select the untranslated entries once; every later step works on this list, not the whole file
+            pending_entries = [entry for entry in po_file if _needs_translation(entry)]
 
-            texts_to_translate = [entry.msgid for entry in po_file if not entry.msgstr.strip() and entry.msgid]
+            # Repeated msgids (e.g. the same label under different contexts) are translated once
+            texts_to_translate = list(dict.fromkeys(entry.msgid for entry in pending_entries))
             translations = self.get_translations(texts_to_translate, file_lang, po_file_path)
 
-            self._update_po_entries(po_file, translations, file_lang)
-            self._handle_untranslated_entries(po_file, file_lang)
+            self._update_po_entries(pending_entries, dict(zip(texts_to_translate, translations)), file_lang)
+            self._handle_untranslated_entries(pending_entries, file_lang)
+
+            final_translations = {entry.msgid: entry.msgstr for entry in pending_entries if entry.msgstr}
 
-            po_file.save(po_file_path)
+            # Skip rewriting files where no entry received a translation
+            if final_translations:
+                self.po_file_handler.save_po_file(po_file, po_file_path)
             self.po_file_handler.log_translation_status(
                 po_file_path,
                 texts_to_translate,
-                [entry.msgstr for entry in po_file if entry.msgid in texts_to_translate]
+                [final_translations.get(text, "") for text in texts_to_translate]
             )
         except Exception as e:
-            logging.error("Error processing file %s: %s", po_file_path, e)
+            logger.error("Error processing file %s: %s", po_file_path, e)
 
     def _prepare_po_file(self, po_file_path, languages):
-        """Prepares the .po file for translation."""
-        if self.config.fuzzy:
-            self.po_file_handler.disable_fuzzy_translations(po_file_path)
-        po_file = polib.pofile(po_file_path)
+        """
+        Prepares the .po file for translation.
+
+        Returns (po_file, file_lang), or (None, None) when the file's language is not requested. The file is parsed
+        once: the copy parsed while removing fuzzy flags is reused.
+        """
+        po_file = self.po_file_handler.disable_fuzzy_translations(po_file_path) if self.config.fuzzy else None
+        if po_file is None:
+            po_file = polib.pofile(po_file_path)
         file_lang = self.po_file_handler.get_file_language(
             po_file_path,
             po_file,
@@ -403,9 +1118,9 @@ class TranslationService:
             self.config.folder_language
         )
         if not file_lang:
-            logging.warning("Skipping .po file due to language mismatch: %s", po_file_path)
-            return None
-        return po_file
+            logger.warning("Skipping .po file due to language mismatch: %s", po_file_path)
+            return None, None
+        return po_file, file_lang
 
     def get_translations(self, texts, target_language, po_file_path):
         """
@@ -413,46 +1128,59 @@ class TranslationService:
         """
         if self.config.bulk_mode:
             return self.translate_bulk(texts, target_language, po_file_path)
-        return [self.translate_single(text, target_language) for text in texts]
-
-    def _update_po_entries(self, po_file, translations, target_language):
-        """Updates the .po file entries with the provided translations."""
-        for entry, translation in zip((e for e in po_file if not e.msgstr.strip()), translations):
+        return self._map_concurrently(partial(self.translate_single, target_language=target_language), texts)
+
+    def _map_concurrently(self, func, items):
+        """Applies func to each item with up to max_concurrency calls in flight, preserving order."""
+        if self.config.max_concurrency <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=self.config.max_concurrency) as executor:
+            return list(executor.map(func, items))
+
+    def _update_po_entries(self, entries, translation_map, target_language):
+        """Updates the given .po file entries with the provided msgid -> translation mapping."""
+        # Loop invariants, bound once instead of looked up for every entry
+        get_translation = translation_map.get
+        log_updates = logger.isEnabledFor(logging.INFO)
+        for entry in entries:
+            translation = get_translation(entry.msgid, "")
             if translation.strip():
-                self.po_file_handler.update_po_entry(po_file, entry.msgid, translation)
-                logging.info("Translated '%s' to '%s'", entry.msgid, translation)
+                # Set msgstr on the entry itself: po_file.find() would only ever return the first duplicate
+                entry.msgstr = translation
+                if log_updates:
+                    logger.info("Translated '%s' to '%s'", entry.msgid, translation)
             else:
                 self._handle_empty_translation(entry, target_language)
 
     def _handle_empty_translation(self, entry, target_language):
         """Handles cases where the initial translation is empty."""
-        logging.warning("Empty translation for '%s'. Attempting individual translation.", entry.msgid)
+        logger.warning("Empty translation for '%s'. Attempting individual translation.", entry.msgid)
         individual_translation = self.translate_single(entry.msgid, target_language)
         if individual_translation.strip():
-            self.po_file_handler.update_po_entry(entry.po_file, entry.msgid, individual_translation)
-            logging.info(
+            entry.msgstr = individual_translation
+            logger.info(
                 "Individual translation successful: '%s' to '%s'",
                 entry.msgid,
                 individual_translation
             )
         else:
-            logging.error("Failed to translate '%s' after individual attempt.", entry.msgid)
+            logger.error("Failed to translate '%s' after individual attempt.", entry.msgid)
 
-    def _handle_untranslated_entries(self, po_file, target_language):
-        """Handles any remaining untranslated entries in the .po file."""
-        for entry in po_file:
-            if not entry.msgstr.strip() and entry.msgid:
-                logging.warning("Untranslated entry found: '%s'. Attempting final translation.", entry.msgid)
+    def _handle_untranslated_entries(self, entries, target_language):
+        """Handles any of the given entries that are still untranslated."""
+        for entry in entries:
+            if _needs_translation(entry):
+                logger.warning("Untranslated entry found: '%s'. Attempting final translation.", entry.msgid)
                 final_translation = self.translate_single(entry.msgid, target_language)
                 if final_translation.strip():
-                    self.po_file_handler.update_po_entry(po_file, entry.msgid, final_translation)
-                    logging.info(
+                    entry.msgstr = final_translation
+                    logger.info(
                         "Final translation successful: '%s' to '%s'",
                         entry.msgid,
                         final_translation
                     )
                 else:
-                    logging.error("Failed to translate '%s' after final attempt.", entry.msgid)
+                    logger.error("Failed to translate '%s' after final attempt.", entry.msgid)
 
     @staticmethod
     def update_po_entry(po_file, original_text, translated_text):
@@ -462,6 +1190,14 @@ class TranslationService:
             entry.msgstr = translated_text
 
 
+def _positive_int(value):
+    """argparse type for options that need a count of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
 def main():
     """Main function to parse arguments and initiate processing."""
 
@@ -478,11 +1214,37 @@ def main():
     parser.add_argument("--fuzzy", action="store_true", help="Remove fuzzy entries")
     parser.add_argument("--bulk", action="store_true", help="Use bulk translation mode")
     parser.add_argument("--bulksize", type=int, default=50, help="Batch size for bulk translation")
+    parser.add_argument(
+        "--bulktokens", type=int, default=2500, help="Token budget of the texts in one bulk request"
+    )
     parser.add_argument("--model", default="gpt-3.5-turbo-0125", help="OpenAI model to use for translations")
     parser.add_argument("--api_key", help="OpenAI API key")
+    parser.add_argument(
+        "--strict-validation", action="store_true", help="Validate the connection with a test completion request"
+    )
     parser.add_argument("--folder-language", action="store_true", help="Set language from directory structure")
+    parser.add_argument(
+        "--concurrency", type=_positive_int, default=8, help="Maximum number of concurrent translation requests"
+    )
+    parser.add_argument("--workers", type=_positive_int, default=8, help="Number of .po files processed in parallel")
+    parser.add_argument("--rpm", type=_positive_int, help="Maximum number of API requests per minute")
+    parser.add_argument("--tpm", type=_positive_int, help="Maximum number of estimated prompt tokens per minute")
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="Stream single translations and stop generating as soon as the model starts explaining"
+    )
+    parser.add_argument(
+        "--cache", nargs='?', const=DEFAULT_CACHE_PATH, metavar="PATH",
+        help=f"Reuse translations from earlier runs, stored in an SQLite file (default: {DEFAULT_CACHE_PATH})"
+    )
+    parser.add_argument(
+        "--cache-ttl", type=float, metavar="DAYS", help="Translate cached strings again once they are older than this"
+    )
+    parser.add_argument("--cache-clear", action="store_true", help="Empty the translation cache before translating")
 
     args = parser.parse_args()
+    if args.cache is None and (args.cache_ttl is not None or args.cache_clear):
+        parser.error("--cache-ttl and --cache-clear require --cache")
 
     # Initialize OpenAI client
     api_key = args.api_key if args.api_key else os.getenv("OPENAI_API_KEY")
@@ -505,20 +1267,35 @@ def main():
         client=client,
         model=args.model,
         bulk_mode=args.bulk,  # Changed bulk to bulk_mode
+        bulk_token_budget=args.bulktokens,
         fuzzy=args.fuzzy,
-        folder_language=args.folder_language
+        folder_language=args.folder_language,
+        max_concurrency=args.concurrency,
+        file_workers=args.workers,
+        requests_per_minute=args.rpm,
+        tokens_per_minute=args.tpm,
+        cache_path=args.cache,
+        cache_max_age=args.cache_ttl * 86400 if args.cache_ttl is not None else None,
+        strict_validation=args.strict_validation,
+        stream=args.stream
     )
 
     # Initialize the translation service with the configuration object
     translation_service = TranslationService(config, args.bulksize)
 
-    # Validate the OpenAI connection
-    if not translation_service.validate_openai_connection():
-        logging.error("OpenAI connection failed. Please check your API key and network connection.")
-        return
-
-    # Pass both languages and detailed languages to the translation service
-    translation_service.scan_and_process_po_files(args.folder, lang_codes)
+    try:
+        if args.cache_clear:
+            translation_service.cache.purge()
+
+        # Validate the OpenAI connection
+        if not translation_service.validate_openai_connection():
+            logger.error("OpenAI connection failed. Please check your API key and network connection.")
+            return
+
+        # Pass both languages and detailed languages to the translation service
+        translation_service.scan_and_process_po_files(args.folder, lang_codes)
+    finally:
+        translation_service.cache.close()
 
 
 if __name__ == "__main__":
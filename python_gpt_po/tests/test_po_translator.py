@@ -3,11 +3,18 @@ This module contains unit tests for the PO Translator.
 """
 
 import logging
+import os
+import stat
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
+import polib
 import pytest
+from openai import BadRequestError, RateLimitError
 
-from python_gpt_po.po_translator import POFileHandler, TranslationConfig, TranslationService
+from python_gpt_po.po_translator import (CircuitBreaker, CircuitOpenError, POFileHandler, RateLimiter, TranslationCache,
+                                         TranslationConfig, TranslationService)
 
 logging.basicConfig(level=logging.INFO)
 
@@ -58,6 +65,8 @@ def test_validate_openai_connection(translation_service):
     Test to validate the OpenAI connection.
     """
     assert translation_service.validate_openai_connection() is True
+    translation_service.config.client.models.retrieve.assert_called_once_with("gpt-3.5-turbo-1106")
+    translation_service.config.client.chat.completions.create.assert_not_called()
 
 
 @patch('python_gpt_po.po_translator.POFileHandler')
@@ -145,3 +154,657 @@ def test_validate_translation(translation_service):
     validated_long = translation_service.validate_translation(original, long_translation)
 
     assert validated_long != long_translation
+
+
+@patch('python_gpt_po.po_translator.POFileHandler.normalize_language_code')
+def test_get_file_language_exact_match(mock_normalize):
+    """
+    Test that an exact metadata match skips language normalization.
+    """
+    po_file = MagicMock()
+    po_file.metadata = {'Language': 'es'}
+
+    file_lang = POFileHandler.get_file_language('locale/es/django.po', po_file, ['es', 'fr'], False)
+
+    assert file_lang == 'es'
+    mock_normalize.assert_not_called()
+
+
+def test_normalize_language_code():
+    """
+    Test normalization of language codes and names to ISO 639-1 codes.
+    """
+    assert POFileHandler.normalize_language_code('fr') == 'fr'
+    assert POFileHandler.normalize_language_code('DE') == 'de'
+    assert POFileHandler.normalize_language_code('Spanish') == 'es'
+    assert POFileHandler.normalize_language_code('xx') is None
+
+
+def test_scan_and_process_po_files(translation_service, tmp_path):
+    """
+    Test that every discovered .po file is processed.
+    """
+    for lang in ('es', 'fr'):
+        (tmp_path / lang).mkdir()
+        (tmp_path / lang / "django.po").write_text('msgid ""\nmsgstr ""\n')
+    (tmp_path / "README.txt").write_text("not a po file")
+
+    with patch.object(translation_service, 'process_po_file') as mock_process:
+        translation_service.scan_and_process_po_files(str(tmp_path), ['es', 'fr'])
+
+    processed = sorted(call.args[0] for call in mock_process.call_args_list)
+    assert processed == [str(tmp_path / "es" / "django.po"), str(tmp_path / "fr" / "django.po")]
+
+
+def test_get_translations_single_mode_preserves_order(translation_service):
+    """
+    Test that concurrent individual translations are returned in input order.
+    """
+    translation_service.config.bulk_mode = False
+    texts = [f"text {i}" for i in range(20)]
+
+    with patch.object(translation_service, 'translate_single', side_effect=lambda text, target_language: text.upper()):
+        translations = translation_service.get_translations(texts, 'es', 'django.po')
+
+    assert translations == [text.upper() for text in texts]
+
+
+def test_translate_bulk_reuses_cached_translations(translation_service, tmp_path):
+    """
+    Test that texts translated before are served from the cache instead of the API.
+    """
+    client = translation_service.config.client
+    po_file_path = str(tmp_path / "django.po")
+
+    client.chat.completions.create.return_value.choices[0].message.content = '["Salud", "Transporte"]'
+    translated_texts = translation_service.translate_bulk(["HEALTHCARE", "TRANSPORT"], 'es', po_file_path)
+    assert translated_texts == ["Salud", "Transporte"]
+
+    client.chat.completions.create.reset_mock()
+    # A single uncached text is sent without the JSON bulk protocol
+    client.chat.completions.create.return_value.choices[0].message.content = 'Servicios'
+    translated_texts = translation_service.translate_bulk(["TRANSPORT", "SERVICES", "HEALTHCARE"], 'es', po_file_path)
+
+    assert translated_texts == ["Transporte", "Servicios", "Salud"]
+    assert client.chat.completions.create.call_count == 1
+
+
+@patch('python_gpt_po.po_translator.time')
+def test_rate_limiter_waits_for_budget(mock_time):
+    """
+    Test that the rate limiter sleeps once the per-minute budget is used up.
+    """
+    mock_time.monotonic.return_value = 0.0
+    limiter = RateLimiter(60)
+
+    limiter.acquire(60)
+    mock_time.sleep.assert_not_called()
+
+    mock_time.sleep.side_effect = lambda seconds: setattr(mock_time.monotonic, 'return_value', seconds)
+    limiter.acquire()
+    mock_time.sleep.assert_called_once_with(1.0)
+
+
+@pytest.mark.parametrize("per_minute", [0, -5])
+def test_rate_limiter_rejects_non_positive_limits(per_minute):
+    """
+    Test that a rate limit that could never admit a request is rejected up front.
+    """
+    with pytest.raises(ValueError):
+        RateLimiter(per_minute)
+
+
+def test_circuit_breaker_opens_after_consecutive_failures():
+    """
+    Test that the circuit breaker fails fast once the failure limit is reached and recovers after a success.
+    """
+    breaker = CircuitBreaker(fail_max=2, reset_timeout=60)
+    breaker.before_call()
+
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    breaker.before_call()
+
+
+@patch('python_gpt_po.po_translator.time')
+def test_circuit_breaker_half_open_admits_single_trial(mock_time):
+    """
+    Test that an expired breaker lets exactly one trial call through until its outcome is recorded.
+    """
+    mock_time.monotonic.return_value = 0
+    breaker = CircuitBreaker(fail_max=1, reset_timeout=30)
+    breaker.record_failure()
+
+    mock_time.monotonic.return_value = 31
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    mock_time.monotonic.return_value = 62
+    breaker.before_call()
+    breaker.record_success()
+    breaker.before_call()
+    breaker.before_call()
+
+
+@patch('python_gpt_po.po_translator.time')
+def test_unexpected_error_releases_half_open_trial(mock_time, translation_service):
+    """
+    Test that a trial call failing with a non-API error does not leave the breaker stuck open.
+    """
+    mock_time.monotonic.return_value = 0
+    translation_service.circuit_breaker = CircuitBreaker(fail_max=1, reset_timeout=30)
+    translation_service.circuit_breaker.record_failure()
+    create = translation_service.config.client.chat.completions.create
+    create.return_value.choices = []
+
+    mock_time.monotonic.return_value = 31
+    with pytest.raises(IndexError):
+        translation_service.perform_translation("HEALTHCARE", 'es')
+
+    create.return_value = MagicMock()
+    create.return_value.choices[0].message.content = "Salud"
+    mock_time.monotonic.return_value = 62
+    assert translation_service.perform_translation("HEALTHCARE", 'es') == "Salud"
+
+
+def test_non_retryable_errors_do_not_open_circuit_breaker(translation_service):
+    """
+    Test that rejected requests (e.g. 400 Bad Request) do not count towards opening the circuit breaker.
+    """
+    response = MagicMock(status_code=400, headers={})
+    translation_service.config.client.chat.completions.create.side_effect = BadRequestError(
+        "Bad request", response=response, body=None
+    )
+
+    for _ in range(translation_service.circuit_breaker.fail_max + 1):
+        with pytest.raises(BadRequestError):
+            translation_service.perform_translation("HEALTHCARE", 'es')
+
+    translation_service.circuit_breaker.before_call()
+
+
+def test_process_po_file_skips_whitespace_msgids(translation_service, tmp_path):
+    """
+    Test that whitespace-only msgids and obsolete entries are not sent for translation.
+    """
+    po_file_path = tmp_path / "django.po"
+    po_file_path.write_text('''msgid ""
+msgstr ""
+"Language: es\\n"
+"Content-Type: text/plain; charset=UTF-8\\n"
+
+msgid "  "
+msgstr ""
+
+msgid "HEALTHCARE"
+msgstr ""
+
+#~ msgid "LEGACY"
+#~ msgstr ""
+''')
+    translation_service.config.client.chat.completions.create.return_value.choices[0].message.content = 'Salud'
+
+    with patch.object(translation_service, 'get_translations', wraps=translation_service.get_translations) as spy:
+        translation_service.process_po_file(str(po_file_path), ['es'])
+
+    assert spy.call_args.args[0] == ["HEALTHCARE"]
+    assert 'msgstr "Salud"' in po_file_path.read_text()
+
+
+def test_translate_bulk_concurrent_chunks_keep_order(translation_service, tmp_path):
+    """
+    Test that concurrently translated chunks are reassembled in input order.
+    """
+    translation_service.batch_size = 2
+    texts = [f"text {i}" for i in range(7)]
+
+    def fake_perform_translation(chunk, *_args, **_kwargs):
+        return [text.upper() for text in chunk]
+
+    with patch.object(translation_service, 'perform_translation', side_effect=fake_perform_translation) as mock:
+        translated_texts = translation_service.translate_bulk(texts, 'es', str(tmp_path / "django.po"))
+
+    assert translated_texts == [text.upper() for text in texts]
+    assert mock.call_count == 4
+
+
+def test_process_po_file_translates_duplicate_msgids_once(translation_service, tmp_path):
+    """
+    Test that a msgid repeated under different contexts is translated once and applied to every entry.
+    """
+    po_file_path = tmp_path / "django.po"
+    po_file_path.write_text('''msgid ""
+msgstr ""
+"Language: es\\n"
+"Content-Type: text/plain; charset=UTF-8\\n"
+
+msgctxt "menu"
+msgid "Open"
+msgstr ""
+
+msgctxt "status"
+msgid "Open"
+msgstr ""
+''')
+    translation_service.config.client.chat.completions.create.return_value.choices[0].message.content = 'Abrir'
+
+    translation_service.process_po_file(str(po_file_path), ['es'])
+
+    assert po_file_path.read_text().count('msgstr "Abrir"') == 2
+    assert translation_service.config.client.chat.completions.create.call_count == 1
+
+
+def test_translation_cache_persists_between_instances(tmp_path):
+    """
+    Test that translations stored in an SQLite cache are available to a new cache instance.
+    """
+    cache_path = str(tmp_path / "cache" / "cache.sqlite")
+    cache = TranslationCache(cache_path)
+    cache.set_many("gpt-4o", "es", None, [("HEALTHCARE", "Salud"), ("TRANSPORT", "")])
+    cache.close()
+
+    reopened = TranslationCache(cache_path)
+    assert reopened.get_many("gpt-4o", "es", None, ["HEALTHCARE", "TRANSPORT"]) == ["Salud", None]
+    assert reopened.get("gpt-4o", "fr", None, "HEALTHCARE") is None
+    reopened.close()
+
+
+def test_translation_cache_expires_old_entries(tmp_path):
+    """
+    Test that entries older than max_age are purged when the cache is reopened.
+    """
+    cache_path = str(tmp_path / "cache.sqlite")
+    with patch('python_gpt_po.po_translator.time.time', return_value=1_000_000):
+        cache = TranslationCache(cache_path)
+        cache.set("gpt-4o", "es", None, "HEALTHCARE", "Salud")
+        cache.close()
+
+    with patch('python_gpt_po.po_translator.time.time', return_value=1_000_000 + 3600):
+        fresh = TranslationCache(cache_path, max_age=7200)
+        assert fresh.get("gpt-4o", "es", None, "HEALTHCARE") == "Salud"
+        fresh.close()
+
+        expired = TranslationCache(cache_path, max_age=60)
+        assert expired.get("gpt-4o", "es", None, "HEALTHCARE") is None
+        expired.close()
+
+
+def test_translate_single_shares_inflight_requests(translation_service):
+    """
+    Test that concurrent requests for the same text wait for a single API call.
+    """
+    started = threading.Event()
+    waiting = threading.Event()
+    release = threading.Event()
+
+    def slow_translation(*_args, **_kwargs):
+        started.set()
+        release.wait(5)
+        return "Salud"
+
+    class WatchedFuture(Future):
+        """Future that signals when a second caller starts waiting on it."""
+
+        def result(self, timeout=None):
+            waiting.set()
+            return super().result(timeout)
+
+    with patch.object(translation_service, 'perform_translation', side_effect=slow_translation) as mock, \
+            patch('python_gpt_po.po_translator.Future', WatchedFuture):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(translation_service.translate_single, "HEALTHCARE", 'es')
+            assert started.wait(5)
+            second = executor.submit(translation_service.translate_single, "HEALTHCARE", 'es')
+            assert waiting.wait(5)
+            release.set()
+            assert first.result() == second.result() == "Salud"
+
+    assert mock.call_count == 1
+
+
+def test_translate_single_rechecks_cache_as_new_owner(translation_service):
+    """
+    Test that a caller finding the cache filled after its first lookup does not call the API again.
+    """
+    with patch.object(TranslationCache, 'get', side_effect=[None, "Salud"]), \
+            patch.object(translation_service, 'perform_translation') as mock:
+        assert translation_service.translate_single("HEALTHCARE", 'es') == "Salud"
+
+    mock.assert_not_called()
+
+
+def test_translate_bulk_accepts_fenced_json(translation_service, tmp_path):
+    """
+    Test that a bulk response wrapped in a markdown code fence is still parsed.
+    """
+    translation_service.config.client.chat.completions.create.return_value.choices[0].message.content = (
+        'Here you go:\n```json\n["Salud", "Transporte"]\n```'
+    )
+
+    translated_texts = translation_service.translate_bulk(["HEALTHCARE", "TRANSPORT"], 'es', str(tmp_path / "a.po"))
+
+    assert translated_texts == ["Salud", "Transporte"]
+
+
+def test_translate_bulk_chunks_respect_count_and_token_budget(translation_service, tmp_path):
+    """
+    Test that bulk chunks are bounded by both the batch size and the token budget.
+    """
+    translation_service.batch_size = 3
+    translation_service.config.bulk_token_budget = 10
+    translation_service.config.max_concurrency = 1
+    long_text = "the quick brown fox jumps over the lazy dog " * 2
+
+    with patch.object(translation_service, 'perform_translation', side_effect=lambda chunk, *_a, **_k: chunk) as mock:
+        translation_service.translate_bulk(["a", "b", "c", "d", long_text, "e"], 'es', str(tmp_path / "a.po"))
+
+    assert [call.args[0] for call in mock.call_args_list] == [["a", "b", "c"], ["d"], [long_text], ["e"]]
+
+
+def test_validate_translation_detects_explanations(translation_service):
+    """
+    Test that explanatory responses are retried regardless of their casing.
+    """
+    with patch.object(translation_service, 'retry_long_translation', return_value="Salud") as mock_retry:
+        assert translation_service.validate_translation("HEALTHCARE", "i'm SORRY, no") == "Salud"
+        assert translation_service.validate_translation("HEALTHCARE", "Sanidad") == "Sanidad"
+
+    mock_retry.assert_called_once()
+
+
+def test_save_po_file_is_atomic(tmp_path):
+    """
+    Test that a failed save leaves the original file and no temporary file behind.
+    """
+    po_file_path = tmp_path / "django.po"
+    po_file_path.write_text("original")
+    po_file = MagicMock()
+
+    def failing_save(path):
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write("partial")
+        raise OSError("disk full")
+
+    po_file.save.side_effect = failing_save
+
+    with pytest.raises(OSError):
+        POFileHandler.save_po_file(po_file, str(po_file_path))
+
+    assert po_file_path.read_text() == "original"
+    assert [path.name for path in tmp_path.iterdir()] == ["django.po"]
+
+
+def test_perform_translation_rejects_short_bulk_response(translation_service):
+    """
+    Test that a valid but short bulk response is rejected instead of being matched to the wrong texts.
+    """
+    create = translation_service.config.client.chat.completions.create
+    create.return_value.choices[0].message.content = '["Salud", "Servicios"]'
+
+    with pytest.raises(ValueError):
+        translation_service.perform_translation(["HEALTHCARE", "TRANSPORT", "SERVICES"], 'es', is_bulk=True)
+
+    assert create.call_count == 1
+
+
+def test_perform_translation_repairs_invalid_json(translation_service):
+    """
+    Test that invalid bulk JSON triggers a single repair request.
+    """
+    create = translation_service.config.client.chat.completions.create
+    broken, repaired = MagicMock(), MagicMock()
+    broken.choices[0].message.content = '["Salud", "Transporte"'
+    repaired.choices[0].message.content = '["Salud", "Transporte"]'
+    create.side_effect = [broken, repaired]
+
+    translations = translation_service.perform_translation(["HEALTHCARE", "TRANSPORT"], 'es', is_bulk=True)
+
+    assert translations == ["Salud", "Transporte"]
+    assert create.call_args.kwargs['messages'][1] == {"role": "assistant", "content": '["Salud", "Transporte"'}
+
+
+def test_streamed_translation_stops_at_explanation(translation_service):
+    """
+    Test that a streamed reply is abandoned once it opens with an explanation, falling through to the concise retry.
+    """
+    translation_service.config.stream = True
+    create = translation_service.config.client.chat.completions.create
+
+    def make_chunk(text):
+        chunk = MagicMock()
+        chunk.choices[0].delta.content = text
+        return chunk
+
+    explanation = [make_chunk("I'm sorry, but this refers to a concept " * 4)] + [make_chunk("unread")] * 50
+    stream = MagicMock()
+    stream.__iter__.return_value = iter(explanation)
+    retried = MagicMock()
+    retried.choices[0].message.content = "Salud"
+    create.side_effect = [stream, retried]
+
+    assert translation_service.perform_translation("HEALTHCARE", 'es') == "Salud"
+    assert create.call_args_list[0].kwargs['stream'] is True
+    stream.close.assert_called_once()
+
+
+def test_process_po_file_retries_empty_bulk_translation_individually(translation_service, tmp_path):
+    """
+    Test that an entry left empty by the bulk response is filled in by an individual translation.
+    """
+    po_file_path = tmp_path / "django.po"
+    po_file_path.write_text('''msgid ""
+msgstr ""
+"Language: es\\n"
+"Content-Type: text/plain; charset=UTF-8\\n"
+
+msgid "HEALTHCARE"
+msgstr ""
+
+msgid "TRANSPORT"
+msgstr ""
+''')
+    create = translation_service.config.client.chat.completions.create
+    bulk, single = MagicMock(), MagicMock()
+    bulk.choices[0].message.content = '["Salud", ""]'
+    single.choices[0].message.content = "Transporte"
+    create.side_effect = [bulk, single]
+
+    translation_service.process_po_file(str(po_file_path), ['es'])
+
+    content = po_file_path.read_text()
+    assert 'msgstr "Salud"' in content
+    assert 'msgstr "Transporte"' in content
+
+
+@patch('time.sleep')
+def test_perform_translation_honours_retry_after(mock_sleep, translation_service):
+    """
+    Test that a rate-limited request is retried after the delay given in the Retry-After header.
+    """
+    response = MagicMock(status_code=429, headers={"retry-after": "3"})
+    success = MagicMock()
+    success.choices[0].message.content = "Salud"
+    translation_service.config.client.chat.completions.create.side_effect = [
+        RateLimitError("Rate limit reached", response=response, body=None),
+        success
+    ]
+
+    assert translation_service.perform_translation("HEALTHCARE", 'es') == "Salud"
+    mock_sleep.assert_called_once_with(3.0)
+
+
+def test_translate_bulk_sends_repeated_texts_once(translation_service, tmp_path):
+    """
+    Test that repeated texts are translated once and the result is returned for every occurrence.
+    """
+    with patch.object(
+        translation_service, 'perform_translation', side_effect=lambda chunk, *_a, **_k: [t.lower() for t in chunk]
+    ) as mock:
+        translated_texts = translation_service.translate_bulk(
+            ["SAVE", "CANCEL", "SAVE", "SAVE"], 'es', str(tmp_path / "a.po")
+        )
+
+    assert translated_texts == ["save", "cancel", "save", "save"]
+    assert mock.call_args.args[0] == ["SAVE", "CANCEL"]
+
+
+def test_translate_bulk_accepts_typographic_quotes(translation_service, tmp_path):
+    """
+    Test that a bulk response delimited with typographic quotes is parsed without a repair request.
+    """
+    create = translation_service.config.client.chat.completions.create
+    create.return_value.choices[0].message.content = '[“Salud”, “Transporte”]'
+
+    translated_texts = translation_service.translate_bulk(["HEALTHCARE", "TRANSPORT"], 'es', str(tmp_path / "a.po"))
+
+    assert translated_texts == ["Salud", "Transporte"]
+    assert create.call_count == 1
+
+
+def test_bulk_retries_rejected_translations_in_target_language(translation_service):
+    """
+    Test that only rejected bulk translations are retried, using the requested target language.
+    """
+    translation_service.config.client.chat.completions.create.return_value.choices[0].message.content = (
+        '["Salud", "I cannot translate this text without more context", "Servicios"]'
+    )
+
+    with patch.object(translation_service, 'retry_long_translation', return_value="Transporte") as mock_retry:
+        translations = translation_service.perform_translation(
+            ["HEALTHCARE", "TRANSPORT", "SERVICES"], 'es', is_bulk=True, detail_language="Spanish"
+        )
+
+    assert translations == ["Salud", "Transporte", "Servicios"]
+    mock_retry.assert_called_once_with("TRANSPORT", "Spanish")
+
+
+def test_translate_bulk_skips_api_when_everything_is_cached(translation_service, tmp_path):
+    """
+    Test that no request is sent when every text is already cached.
+    """
+    translation_service.cache.set_many(
+        translation_service.config.model, 'es', None, [("HEALTHCARE", "Salud"), ("TRANSPORT", "Transporte")]
+    )
+
+    translated_texts = translation_service.translate_bulk(["TRANSPORT", "HEALTHCARE"], 'es', str(tmp_path / "a.po"))
+
+    assert translated_texts == ["Transporte", "Salud"]
+    translation_service.config.client.chat.completions.create.assert_not_called()
+
+
+def test_disable_fuzzy_translations(tmp_path):
+    """
+    Test that fuzzy flags are removed from the header and from entries, keeping other flags.
+    """
+    po_file_path = tmp_path / "django.po"
+    po_file_path.write_text('''#, fuzzy
+msgid ""
+msgstr ""
+"Language: es\\n"
+"Content-Type: text/plain; charset=UTF-8\\n"
+
+#, fuzzy
+msgid "HEALTHCARE"
+msgstr "Salud"
+
+#, fuzzy, python-format
+msgid "%(count)s items"
+msgstr "%(count)s elementos"
+''')
+
+    POFileHandler.disable_fuzzy_translations(str(po_file_path))
+
+    content = po_file_path.read_text()
+    assert 'fuzzy' not in content
+    assert '#, python-format' in content
+    assert 'msgstr "Salud"' in content
+
+
+def test_process_po_file_parses_fuzzy_file_once(translation_service, tmp_path):
+    """
+    Test that a file unflagged by the fuzzy handling is not parsed a second time for translation.
+    """
+    po_file_path = tmp_path / "django.po"
+    po_file_path.write_text('''msgid ""
+msgstr ""
+"Language: es\\n"
+"Content-Type: text/plain; charset=UTF-8\\n"
+
+#, fuzzy
+msgid "HEALTHCARE"
+msgstr ""
+''')
+    translation_service.config.fuzzy = True
+    translation_service.config.client.chat.completions.create.return_value.choices[0].message.content = 'Salud'
+
+    with patch('python_gpt_po.po_translator.polib.pofile', wraps=polib.pofile) as spy:
+        translation_service.process_po_file(str(po_file_path), ['es'])
+
+    assert spy.call_count == 1
+    content = po_file_path.read_text()
+    assert 'fuzzy' not in content
+    assert 'msgstr "Salud"' in content
+
+
+def test_process_files_clamps_worker_count():
+    """
+    Test that a worker count below 1 processes the files sequentially instead of failing.
+    """
+    assert POFileHandler.process_files(["a.po", "b.po"], str.upper, max_workers=0) == ["A.PO", "B.PO"]
+
+
+def test_save_po_file_keeps_permissions_and_neighbours(tmp_path):
+    """
+    Test that saving keeps the file's permission bits and never touches a same-named .tmp file.
+    """
+    po_file_path = tmp_path / "django.po"
+    po_file_path.write_text('msgid ""\nmsgstr ""\n')
+    os.chmod(po_file_path, 0o664)
+    neighbour = tmp_path / "django.po.tmp"
+    neighbour.write_text("user data")
+
+    POFileHandler.save_po_file(polib.pofile(str(po_file_path)), str(po_file_path))
+
+    assert stat.S_IMODE(os.stat(po_file_path).st_mode) == 0o664
+    assert neighbour.read_text() == "user data"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["django.po", "django.po.tmp"]
+
+
+def test_failed_retry_keeps_source_text_uncached(translation_service):
+    """
+    Test that the source text used when a retry fails is returned but never cached as a translation.
+    """
+    explanation, failure = MagicMock(), BadRequestError("Bad request", response=MagicMock(status_code=400), body=None)
+    explanation.choices[0].message.content = "I'm sorry, I cannot translate that"
+    translation_service.config.client.chat.completions.create.side_effect = [explanation, failure]
+
+    assert translation_service.translate_single("HEALTHCARE", 'es') == "HEALTHCARE"
+    assert translation_service.cache.get(translation_service.config.model, 'es', None, "HEALTHCARE") is None
+
+
+def test_save_po_file_writes_through_symlinks(tmp_path):
+    """
+    Test that saving a symlinked .po file updates its target and keeps the link.
+    """
+    real_path = tmp_path / "real.po"
+    real_path.write_text('msgid ""\nmsgstr ""\n\nmsgid "HEALTHCARE"\nmsgstr ""\n')
+    (tmp_path / "loc").mkdir()
+    link_path = tmp_path / "loc" / "django.po"
+    link_path.symlink_to(os.path.join("..", "real.po"))
+
+    po_file = polib.pofile(str(link_path))
+    po_file.find("HEALTHCARE").msgstr = "Salud"
+    POFileHandler.save_po_file(po_file, str(link_path))
+
+    assert link_path.is_symlink()
+    assert polib.pofile(str(real_path)).find("HEALTHCARE").msgstr == "Salud"
@@ -29,6 +29,10 @@ setup(
         'tenacity==9.0.0',
         'pycountry==24.6.1'
     ],
+    extras_require={
+        'speedups': ['orjson'],
+        'tokenizer': ['tiktoken'],
+    },
     entry_points={
         'console_scripts': [
             'gpt-po-translator=python_gpt_po.po_translator:main',